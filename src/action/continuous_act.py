@@ -17,8 +17,10 @@ class ContinuousAction:
     def parse_actions(self, actions: np.ndarray, state: GameState) -> np.ndarray:
         actions = actions.reshape((-1, 8))
 
-        actions[..., :5] = actions[..., :5].clip(-1, 1)
+        # Clip and binarize in place so no temporary arrays are allocated every tick.
+        # Unsafe casting writes the results back into whatever dtype the policy produced, like slice assignment did.
+        np.clip(actions[..., :5], -1, 1, out=actions[..., :5], casting='unsafe')
         # The final 3 actions handle are jump, boost and handbrake. They are inherently discrete so we convert them to either 0 or 1.
-        actions[..., 5:] = actions[..., 5:] > 0
+        np.greater(actions[..., 5:], 0, out=actions[..., 5:], casting='unsafe')
 
         return actions
\ No newline at end of file
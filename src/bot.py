@@ -63,9 +63,15 @@ class RLGymExampleBot(BaseAgent):
                 # There's no opponent, we assume this model is 1v0
                 self.game_state.players = [player]
             else:
-                # Sort by distance to ball
-                teammates.sort(key=lambda p: np.linalg.norm(self.game_state.ball.position - p.car_data.position))
-                opponents.sort(key=lambda p: np.linalg.norm(self.game_state.ball.position - p.car_data.position))
+                # Sort by distance to ball, squared distance gives the same ordering without the sqrt
+                ball_position = self.game_state.ball.position
+
+                def ball_dist_sq(p):
+                    offset = ball_position - p.car_data.position
+                    return offset.dot(offset)
+
+                teammates.sort(key=ball_dist_sq)
+                opponents.sort(key=ball_dist_sq)
 
                 # Grab opponent in same "position" relative to it's teammates
                 opponent = opponents[min(teammates.index(player), len(opponents) - 1)]